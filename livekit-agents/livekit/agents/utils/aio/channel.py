@@ -88,14 +88,16 @@ class Chan(Generic[T]):
         self.send_nowait(value)
 
     def send_nowait(self, value: T) -> None:
-        if self.full():
+        # hot path: inline full()/closed checks to avoid extra method calls
+        if 0 < self._maxsize <= len(self._queue):
             raise ChanFull
 
-        if self._close_ev.is_set():
+        if self._closed:
             raise ChanClosed
 
         self._queue.append(value)
-        self._wakeup_next(self._gets)
+        if self._gets:
+            self._wakeup_next(self._gets)
 
     async def recv(self) -> T:
         while self.empty() and not self._close_ev.is_set():
@@ -119,15 +121,16 @@ class Chan(Generic[T]):
         return self.recv_nowait()
 
     def recv_nowait(self) -> T:
-        if self.empty():
-            if self._close_ev.is_set():
+        if not self._queue:
+            if self._closed:
                 raise ChanClosed
             else:
                 raise ChanEmpty
         item = self._queue.popleft()
         #        if self.empty() and self._close_ev.is_set():
         #            self._finished_ev.set()
-        self._wakeup_next(self._puts)
+        if self._puts:
+            self._wakeup_next(self._puts)
         return item
 
     def close(self) -> None:
@@ -1,6 +1,7 @@
+import typing
+
 from .agent import Agent, AgentTask, ModelSettings
 from .agent_session import AgentSession, VoiceActivityVideoSampler
-from .chat_cli import ChatCLI
 from .events import (
     AgentEvent,
     AgentFalseInterruptionEvent,
@@ -18,6 +19,21 @@ from .events import (
 )
 from .speech_handle import SpeechHandle
 
+if typing.TYPE_CHECKING:
+    from .chat_cli import ChatCLI
+
+
+def __getattr__(name: str) -> typing.Any:
+    # ChatCLI pulls in numpy and the audio device stack; import it lazily so
+    # sessions that never use the console mode don't pay for it at import time
+    if name == "ChatCLI":
+        from .chat_cli import ChatCLI
+
+        return ChatCLI
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "ChatCLI",
     "AgentSession",
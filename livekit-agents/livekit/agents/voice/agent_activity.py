@@ -679,7 +679,9 @@ class AgentActivity(RecognitionHooks):
         )
         self._session.emit(
             "speech_created",
-            SpeechCreatedEvent(speech_handle=handle, user_initiated=True, source="say"),
+            SpeechCreatedEvent.model_construct(
+                speech_handle=handle, user_initiated=True, source="say"
+            ),
         )
 
         task = self._create_speech_task(
@@ -735,7 +737,9 @@ class AgentActivity(RecognitionHooks):
         )
         self._session.emit(
             "speech_created",
-            SpeechCreatedEvent(speech_handle=handle, user_initiated=True, source="generate_reply"),
+            SpeechCreatedEvent.model_construct(
+                speech_handle=handle, user_initiated=True, source="generate_reply"
+            ),
         )
 
         if isinstance(self.llm, llm.RealtimeModel):
@@ -924,7 +928,7 @@ class AgentActivity(RecognitionHooks):
             isinstance(ev, LLMMetrics) or isinstance(ev, TTSMetrics)
         ):
             ev.speech_id = speech_handle.id
-        self._session.emit("metrics_collected", MetricsCollectedEvent(metrics=ev))
+        self._session.emit("metrics_collected", MetricsCollectedEvent.model_construct(metrics=ev))
 
     def _on_error(
         self, error: llm.LLMError | stt.STTError | tts.TTSError | llm.RealtimeModelError
@@ -963,12 +967,14 @@ class AgentActivity(RecognitionHooks):
 
         if ev.user_transcription_enabled:
             self._session._user_input_transcribed(
-                UserInputTranscribedEvent(transcript="", is_final=False)
+                UserInputTranscribedEvent.model_construct(transcript="", is_final=False)
             )
 
     def _on_input_audio_transcription_completed(self, ev: llm.InputTranscriptionCompleted) -> None:
         self._session._user_input_transcribed(
-            UserInputTranscribedEvent(transcript=ev.transcript, is_final=ev.is_final)
+            UserInputTranscribedEvent.model_construct(
+                transcript=ev.transcript, is_final=ev.is_final
+            )
         )
 
         if ev.is_final:
@@ -989,7 +995,9 @@ class AgentActivity(RecognitionHooks):
         handle = SpeechHandle.create(allow_interruptions=self.allow_interruptions)
         self._session.emit(
             "speech_created",
-            SpeechCreatedEvent(speech_handle=handle, user_initiated=False, source="generate_reply"),
+            SpeechCreatedEvent.model_construct(
+                speech_handle=handle, user_initiated=False, source="generate_reply"
+            ),
         )
 
         self._create_speech_task(
@@ -1059,7 +1067,7 @@ class AgentActivity(RecognitionHooks):
             return
 
         self._session._user_input_transcribed(
-            UserInputTranscribedEvent(
+            UserInputTranscribedEvent.model_construct(
                 transcript=ev.alternatives[0].text,
                 is_final=False,
                 speaker_id=ev.alternatives[0].speaker_id,
@@ -1072,7 +1080,7 @@ class AgentActivity(RecognitionHooks):
             return
 
         self._session._user_input_transcribed(
-            UserInputTranscribedEvent(
+            UserInputTranscribedEvent.model_construct(
                 transcript=ev.alternatives[0].text,
                 is_final=True,
                 speaker_id=ev.alternatives[0].speaker_id,
@@ -1263,7 +1271,9 @@ class AgentActivity(RecognitionHooks):
             speech_id=speech_handle.id,
             last_speaking_time=info.last_speaking_time,
         )
-        self._session.emit("metrics_collected", MetricsCollectedEvent(metrics=eou_metrics))
+        self._session.emit(
+            "metrics_collected", MetricsCollectedEvent.model_construct(metrics=eou_metrics)
+        )
 
     # AudioRecognition is calling this method to retrieve the chat context before running the TurnDetector model  # noqa: E501
     def retrieve_chat_ctx(self) -> llm.ChatContext:
@@ -1402,7 +1412,9 @@ class AgentActivity(RecognitionHooks):
 
             if speech_handle._interrupted_by_user:
                 self._session._schedule_agent_false_interruption(
-                    AgentFalseInterruptionEvent(extra_instructions=None, message=msg)
+                    AgentFalseInterruptionEvent.model_construct(
+                        extra_instructions=None, message=msg
+                    )
                 )
 
         if self._session.agent_state == "speaking":
@@ -1617,7 +1629,9 @@ class AgentActivity(RecognitionHooks):
 
             if speech_handle._interrupted_by_user:
                 self._session._schedule_agent_false_interruption(
-                    AgentFalseInterruptionEvent(extra_instructions=instructions, message=copy_msg)
+                    AgentFalseInterruptionEvent.model_construct(
+                        extra_instructions=instructions, message=copy_msg
+                    )
                 )
 
             if self._session.agent_state == "speaking":
@@ -1661,7 +1675,7 @@ class AgentActivity(RecognitionHooks):
             generate_tool_reply: bool = False
             new_agent_task: Agent | None = None
             ignore_task_switch = False
-            fnc_executed_ev = FunctionToolsExecutedEvent(
+            fnc_executed_ev = FunctionToolsExecutedEvent.model_construct(
                 function_calls=[], function_call_outputs=[]
             )
             for sanitized_out in tool_output.output:
@@ -1978,7 +1992,9 @@ class AgentActivity(RecognitionHooks):
 
                 if speech_handle._interrupted_by_user:
                     self._session._schedule_agent_false_interruption(
-                        AgentFalseInterruptionEvent(extra_instructions=instructions, message=msg)
+                        AgentFalseInterruptionEvent.model_construct(
+                            extra_instructions=instructions, message=msg
+                        )
                     )
 
             speech_handle._mark_generation_done()
@@ -2018,7 +2034,7 @@ class AgentActivity(RecognitionHooks):
 
             new_fnc_outputs: list[llm.FunctionCallOutput] = []
             generate_tool_reply: bool = False
-            fnc_executed_ev = FunctionToolsExecutedEvent(
+            fnc_executed_ev = FunctionToolsExecutedEvent.model_construct(
                 function_calls=[],
                 function_call_outputs=[],
             )
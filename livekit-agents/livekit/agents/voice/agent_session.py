@@ -957,7 +957,7 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
         self._agent_state = state
         self.emit(
             "agent_state_changed",
-            AgentStateChangedEvent(old_state=old_state, new_state=state),
+            AgentStateChangedEvent.model_construct(old_state=old_state, new_state=state),
         )
 
     def _update_user_state(
@@ -992,7 +992,7 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
         self._user_state = state
         self.emit(
             "user_state_changed",
-            UserStateChangedEvent(old_state=old_state, new_state=state),
+            UserStateChangedEvent.model_construct(old_state=old_state, new_state=state),
         )
 
     def _user_input_transcribed(self, ev: UserInputTranscribedEvent) -> None:
@@ -1003,7 +1003,9 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
 
     def _conversation_item_added(self, message: llm.ChatMessage) -> None:
         self._chat_ctx.insert(message)
-        self.emit("conversation_item_added", ConversationItemAddedEvent(item=message))
+        self.emit(
+            "conversation_item_added", ConversationItemAddedEvent.model_construct(item=message)
+        )
 
     def _schedule_agent_false_interruption(self, ev: AgentFalseInterruptionEvent) -> None:
         if self._opts.agent_false_interruption_timeout is None:
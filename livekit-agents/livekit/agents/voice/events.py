@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator
 from enum import Enum, unique
 from typing import TYPE_CHECKING, Annotated, Any, Generic, Literal, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
-from typing_extensions import Self
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
 
 from ..llm import (
     LLM,
@@ -24,11 +24,17 @@ from .speech_handle import SpeechHandle
 if TYPE_CHECKING:
     from .agent_session import AgentSession
 
+# created_at is wall-clock on purpose: events are serialized and compared
+# against epoch timestamps by consumers
+_now = time.time
+
 
 Userdata_T = TypeVar("Userdata_T")
 
 
 class RunContext(Generic[Userdata_T]):
+    __slots__ = ("_session", "_speech_handle", "_function_call", "_initial_step_idx")
+
     # private ctor
     def __init__(
         self,
@@ -101,14 +107,14 @@ class UserStateChangedEvent(BaseModel):
     type: Literal["user_state_changed"] = "user_state_changed"
     old_state: UserState
     new_state: UserState
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 class AgentStateChangedEvent(BaseModel):
     type: Literal["agent_state_changed"] = "agent_state_changed"
     old_state: AgentState
     new_state: AgentState
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 class UserInputTranscribedEvent(BaseModel):
@@ -116,7 +122,7 @@ class UserInputTranscribedEvent(BaseModel):
     transcript: str
     is_final: bool
     speaker_id: str | None = None
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 class AgentFalseInterruptionEvent(BaseModel):
@@ -127,13 +133,13 @@ class AgentFalseInterruptionEvent(BaseModel):
     """Optional instructions originally passed to `AgentSession.generate_reply` via the `instructions` argument.
     Populated only if the user interrupted a speech response generated using `session.generate_reply`.
     Useful for understanding what the agent was attempting to convey before the interruption."""
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 class MetricsCollectedEvent(BaseModel):
     type: Literal["metrics_collected"] = "metrics_collected"
     metrics: AgentMetrics
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 class _TypeDiscriminator(BaseModel):
@@ -143,24 +149,22 @@ class _TypeDiscriminator(BaseModel):
 class ConversationItemAddedEvent(BaseModel):
     type: Literal["conversation_item_added"] = "conversation_item_added"
     item: ChatMessage | _TypeDiscriminator
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 class FunctionToolsExecutedEvent(BaseModel):
     type: Literal["function_tools_executed"] = "function_tools_executed"
-    function_calls: list[FunctionCall]
-    function_call_outputs: list[FunctionCallOutput | None]
-    created_at: float = Field(default_factory=time.time)
-
-    def zipped(self) -> list[tuple[FunctionCall, FunctionCallOutput | None]]:
-        return list(zip(self.function_calls, self.function_call_outputs))
+    function_calls: SkipValidation[list[FunctionCall]]
+    function_call_outputs: SkipValidation[list[FunctionCallOutput | None]]
+    created_at: float = Field(default_factory=_now)
 
-    @model_validator(mode="after")
-    def verify_lists_length(self) -> Self:
-        if len(self.function_calls) != len(self.function_call_outputs):
-            raise ValueError("The number of function_calls and function_call_outputs must match.")
+    def zipped(self) -> Iterator[tuple[FunctionCall, FunctionCallOutput | None]]:
+        return zip(self.function_calls, self.function_call_outputs)
 
-        return self
+    def model_post_init(self, __context: Any) -> None:
+        assert len(self.function_calls) == len(self.function_call_outputs), (
+            "The number of function_calls and function_call_outputs must match."
+        )
 
 
 class SpeechCreatedEvent(BaseModel):
@@ -173,7 +177,7 @@ class SpeechCreatedEvent(BaseModel):
     """Source indicating how the speech handle was created"""
     speech_handle: SpeechHandle = Field(..., exclude=True)
     """The speech handle that was created"""
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 class ErrorEvent(BaseModel):
@@ -181,7 +185,7 @@ class ErrorEvent(BaseModel):
     type: Literal["error"] = "error"
     error: LLMError | STTError | TTSError | RealtimeModelError | Any
     source: LLM | STT | TTS | RealtimeModel | Any
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 @unique
@@ -197,7 +201,7 @@ class CloseEvent(BaseModel):
     type: Literal["close"] = "close"
     error: LLMError | STTError | TTSError | RealtimeModelError | None = None
     reason: CloseReason
-    created_at: float = Field(default_factory=time.time)
+    created_at: float = Field(default_factory=_now)
 
 
 AgentEvent = Annotated[
@@ -21,6 +21,7 @@ import json
 import os
 import weakref
 from dataclasses import dataclass
+from typing import Any
 from urllib.parse import urlencode
 
 import aiohttp
@@ -40,6 +41,16 @@ from livekit.agents.utils import AudioBuffer, is_given
 
 from .log import logger
 
+_BASE_WS_URL = "wss://streaming.assemblyai.com/v3/ws"
+
+_CLOSING_WS_MSG_TYPES = frozenset(
+    (
+        aiohttp.WSMsgType.CLOSED,
+        aiohttp.WSMsgType.CLOSE,
+        aiohttp.WSMsgType.CLOSING,
+    )
+)
+
 
 @dataclass
 class STTOptions:
@@ -169,6 +180,15 @@ class SpeechStream(stt.SpeechStream):
         self._session = http_session
         self._speech_duration: float = 0
         self._reconnect_event = asyncio.Event()
+        self._samples_per_buffer = self._compute_samples_per_buffer()
+        self._ws_headers = {
+            "Authorization": self._api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "AssemblyAI/1.0 (integration=Livekit)",
+        }
+
+    def _compute_samples_per_buffer(self) -> int:
+        return self._opts.sample_rate // round(1 / self._opts.buffer_size_seconds)
 
     def update_options(
         self,
@@ -180,6 +200,7 @@ class SpeechStream(stt.SpeechStream):
     ) -> None:
         if is_given(buffer_size_seconds):
             self._opts.buffer_size_seconds = buffer_size_seconds
+            self._samples_per_buffer = self._compute_samples_per_buffer()
         if is_given(end_of_turn_confidence_threshold):
             self._opts.end_of_turn_confidence_threshold = end_of_turn_confidence_threshold
         if is_given(min_end_of_turn_silence_when_confident):
@@ -202,11 +223,10 @@ class SpeechStream(stt.SpeechStream):
         async def send_task(ws: aiohttp.ClientWebSocketResponse) -> None:
             nonlocal closing_ws
 
-            samples_per_buffer = self._opts.sample_rate // round(1 / self._opts.buffer_size_seconds)
             audio_bstream = utils.audio.AudioByteStream(
                 sample_rate=self._opts.sample_rate,
                 num_channels=1,
-                samples_per_channel=samples_per_buffer,
+                samples_per_channel=self._samples_per_buffer,
             )
 
             # forward inputs to AssemblyAI
@@ -216,30 +236,28 @@ class SpeechStream(stt.SpeechStream):
                 if isinstance(data, self._FlushSentinel):
                     frames = audio_bstream.flush()
                 else:
-                    frames = audio_bstream.write(data.data.tobytes())
+                    frames = audio_bstream.write(data.data)
 
                 for frame in frames:
                     self._speech_duration += frame.duration
-                    await ws.send_bytes(frame.data.tobytes())
+                    # cast("b") reinterprets the int16 samples as raw bytes without copying
+                    await ws.send_bytes(frame.data.cast("b"))  # type: ignore[arg-type]
 
             closing_ws = True
             await ws.send_str(SpeechStream._CLOSE_MSG)
 
         async def recv_task(ws: aiohttp.ClientWebSocketResponse) -> None:
             nonlocal closing_ws
+            loads = json.loads
             while True:
                 try:
-                    msg = await asyncio.wait_for(ws.receive(), timeout=5)
+                    msg = await ws.receive(timeout=5)
                 except asyncio.TimeoutError:
                     if closing_ws:
                         break
                     continue
 
-                if msg.type in (
-                    aiohttp.WSMsgType.CLOSED,
-                    aiohttp.WSMsgType.CLOSE,
-                    aiohttp.WSMsgType.CLOSING,
-                ):
+                if msg.type in _CLOSING_WS_MSG_TYPES:
                     if closing_ws:  # close is expected, see SpeechStream.aclose
                         return
 
@@ -252,7 +270,7 @@ class SpeechStream(stt.SpeechStream):
                     continue
 
                 try:
-                    self._process_stream_event(json.loads(msg.data))
+                    self._process_stream_event(loads(msg.data))
                 except Exception:
                     logger.exception("failed to process AssemblyAI message")
 
@@ -265,11 +283,12 @@ class SpeechStream(stt.SpeechStream):
                     asyncio.create_task(send_task(ws)),
                     asyncio.create_task(recv_task(ws)),
                 ]
+                tasks_group = asyncio.gather(*tasks)
                 wait_reconnect_task = asyncio.create_task(self._reconnect_event.wait())
 
                 try:
                     done, _ = await asyncio.wait(
-                        (asyncio.gather(*tasks), wait_reconnect_task),
+                        (tasks_group, wait_reconnect_task),
                         return_when=asyncio.FIRST_COMPLETED,
                     )
                     for task in done:
@@ -282,36 +301,31 @@ class SpeechStream(stt.SpeechStream):
                     self._reconnect_event.clear()
                 finally:
                     await utils.aio.gracefully_cancel(*tasks, wait_reconnect_task)
+                    tasks_group.cancel()
+                    tasks_group.exception()  # retrieve the exception
             finally:
                 if ws is not None:
                     await ws.close()
 
     async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
-        live_config = {
-            "sample_rate": self._opts.sample_rate,
-            "encoding": self._opts.encoding,
-            "format_turns": self._opts.format_turns if is_given(self._opts.format_turns) else None,
-            "end_of_turn_confidence_threshold": self._opts.end_of_turn_confidence_threshold
-            if is_given(self._opts.end_of_turn_confidence_threshold)
-            else None,
-            "min_end_of_turn_silence_when_confident": self._opts.min_end_of_turn_silence_when_confident  # noqa: E501
-            if is_given(self._opts.min_end_of_turn_silence_when_confident)
-            else None,
-            "max_turn_silence": self._opts.max_turn_silence
-            if is_given(self._opts.max_turn_silence)
-            else None,
-        }
-
-        headers = {
-            "Authorization": self._api_key,
-            "Content-Type": "application/json",
-            "User-Agent": "AssemblyAI/1.0 (integration=Livekit)",
+        opts = self._opts
+        live_config: dict[str, Any] = {
+            "sample_rate": opts.sample_rate,
+            "encoding": opts.encoding,
         }
+        if is_given(opts.format_turns):
+            live_config["format_turns"] = opts.format_turns
+        if is_given(opts.end_of_turn_confidence_threshold):
+            live_config["end_of_turn_confidence_threshold"] = opts.end_of_turn_confidence_threshold
+        if is_given(opts.min_end_of_turn_silence_when_confident):
+            live_config["min_end_of_turn_silence_when_confident"] = (
+                opts.min_end_of_turn_silence_when_confident
+            )
+        if is_given(opts.max_turn_silence):
+            live_config["max_turn_silence"] = opts.max_turn_silence
 
-        ws_url = "wss://streaming.assemblyai.com/v3/ws"
-        filtered_config = {k: v for k, v in live_config.items() if v is not None}
-        url = f"{ws_url}?{urlencode(filtered_config).lower()}"
-        ws = await self._session.ws_connect(url, headers=headers)
+        url = f"{_BASE_WS_URL}?{urlencode(live_config).lower()}"
+        ws = await self._session.ws_connect(url, headers=self._ws_headers)
         return ws
 
     def _process_stream_event(self, data: dict) -> None:
@@ -348,8 +362,7 @@ class SpeechStream(stt.SpeechStream):
                     self._speech_duration = 0
 
             else:
-                non_final_words = [word["text"] for word in words if not word["word_is_final"]]
-                interim = " ".join(non_final_words)
+                interim = " ".join(word["text"] for word in words if not word["word_is_final"])
                 interim_event = stt.SpeechEvent(
                     type=stt.SpeechEventType.INTERIM_TRANSCRIPT,
                     alternatives=[stt.SpeechData(language="en-US", text=f"{transcript} {interim}")],